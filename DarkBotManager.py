@@ -11,10 +11,19 @@ DarkBot Manager - Tkinter GUI tool
 
 import os
 import sys
+import errno
 import json
+import hashlib
 import locale
 import shutil
+import subprocess
 import threading
+import time
+import collections
+import functools
+import itertools
+import concurrent.futures
+import multiprocessing
 import traceback
 import webbrowser
 from pathlib import Path
@@ -38,6 +47,47 @@ DEFAULT_CONFIG = {
     "plugin_updates_folder": "",          # folder containing plugin .jar update files
     "language": "en"                     # default language.
 }
+BOT_WORKERS = min(32, (os.cpu_count() or 1) * 4)   # bots processed concurrently by _run_worker
+CLEAR_WORKERS = 4                                  # bots cleared concurrently by clear_old_logs_worker
+CLEAR_PROCESS_MIN_BOTS = 16                        # from this many bots clearing uses processes (Windows only)
+LOG_FLUSH_MS = 33                                  # buffered log lines are written to the widget this often
+MAX_LOGGED_FAILURES = 20                           # per folder, further failed deletes are only counted
+PROGRESS_INTERVAL = 1 / 30                         # min. seconds between progress bar redraws (~30 Hz)
+DARKJAR_BUFFER_LIMIT = 256 * 1024 * 1024           # DarkBot.jar up to this size is read into memory once per run
+# shared by all bots so plugin copies don't spin up a new pool per bot folder
+PLUGIN_COPY_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="plugin-copy")
+# same for large unlink batches; being shared it also caps unlink threads across concurrently processed bots
+UNLINK_CHUNK = 64
+UNLINK_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                                        thread_name_prefix="unlink")
+
+# CopyFile2 (Windows 8+) lets SMB shares do the copy server-side
+_CopyFile2 = None
+if sys.platform == "win32":
+    try:
+        import ctypes
+        _CopyFile2 = ctypes.windll.kernel32.CopyFile2
+        _CopyFile2.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p)
+        _CopyFile2.restype = ctypes.c_long  # HRESULT
+    except (ImportError, AttributeError, OSError):
+        _CopyFile2 = None
+
+# optional faster JSON parser for translations.json, stdlib json otherwise
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_TRANS_CACHE = {}  # (path, mtime_ns) -> parsed translations
+
+# folder opener resolved once: Explorer on Windows, xdg-open / open elsewhere
+if sys.platform == "win32":
+    _open_folder = os.startfile
+else:
+    _FOLDER_OPENER = "xdg-open" if sys.platform.startswith("linux") else "open"
+
+    def _open_folder(path):
+        subprocess.Popen([_FOLDER_OPENER, path])
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -77,15 +127,149 @@ def save_config(cfg):
         json.dump(cfg, f, indent=2)
 
 
-def is_bot_folder(p: Path) -> bool:
-    """Heuristic: a bot folder should be a directory and contain subfolders like logs or plugins."""
-    if not p.is_dir():
-        return False
-    # simple heuristics: has logs or plugins folder
-    if (p / "logs").exists() or (p / "plugins").exists():
-        return True
-    # fallback: treat any directory child of bots_root as bot
-    return True
+def is_bot_folder(entry: os.DirEntry) -> bool:
+    """Heuristic: a bot folder is a directory child of bots_root. Bot folders usually contain
+    logs or plugins, but any directory is accepted as fallback, so the cached d_type is enough."""
+    return entry.is_dir()
+
+
+# suffix tuples for str.endswith; matched case-insensitively on Windows like its globbing
+LOG_SUFFIXES = (".log",)
+JAR_SUFFIXES = (".jar",)
+if os.name == "nt":
+    def _suffix_matches(name, suffixes):
+        return name.lower().endswith(suffixes)
+else:
+    _suffix_matches = str.endswith
+
+
+def _iter_files_suffix(root, suffix, recursive=True):
+    """Yield paths (str) of files under root whose name ends with suffix (str or tuple).
+    Recursive listing is a single os.walk pass (scandir-based, symlinked dirs are not followed);
+    with recursive=False only the direct children of root are listed."""
+    if recursive:
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for name in filenames:
+                if _suffix_matches(name, suffix):
+                    yield os.path.join(dirpath, name)
+        return
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for e in it:
+            # cached d_type: directories that happen to be named *.jar are skipped without a stat
+            if _suffix_matches(e.name, suffix) and not e.is_dir(follow_symlinks=False):
+                yield e.path
+
+
+def _unlink_chunk(paths, dir_fd=None):
+    """Delete paths serially (names relative to dir_fd if given). Return (removed, [(path, error), ...]).
+    The deletes run as a C-level map drained by a zero-length deque; the try/except is only
+    re-entered after a failure, and the map iterator resumes with the next path."""
+    unlink = os.unlink if dir_fd is None else functools.partial(os.unlink, dir_fd=dir_fd)
+    failed = []
+    pending = map(unlink, paths)
+    while True:
+        try:
+            collections.deque(pending, maxlen=0)
+            break
+        except OSError as e:
+            failed.append((e.filename, e))
+    return len(paths) - len(failed), failed
+
+
+def _bulk_unlink(paths, dir_fd=None):
+    """Delete a batch of files collected up front. Return (removed, [(path, error), ...]).
+    Large batches are split into UNLINK_CHUNK pieces deleted concurrently on UNLINK_EXECUTOR."""
+    if len(paths) <= UNLINK_CHUNK:
+        return _unlink_chunk(paths, dir_fd)
+    chunks = [paths[i:i + UNLINK_CHUNK] for i in range(0, len(paths), UNLINK_CHUNK)]
+    removed = 0
+    failed = []
+    for chunk_removed, chunk_failed in UNLINK_EXECUTOR.map(_unlink_chunk, chunks, itertools.repeat(dir_fd)):
+        removed += chunk_removed
+        failed.extend(chunk_failed)
+    return removed, failed
+
+
+# unlinkat() relative to an open directory fd - POSIX only, Windows has no dir_fd support
+_HAVE_DIR_FD = (hasattr(os, "fwalk") and os.unlink in os.supports_dir_fd
+                and os.scandir in os.supports_fd)
+
+
+def _unlink_matching(root, suffixes, recursive=True):
+    """Delete files under root whose name ends with suffixes. Return (removed, [(path, error), ...]).
+    Where supported every directory is opened once and its files are removed with unlinkat()
+    relative to that fd, so the kernel doesn't resolve the full path again for each file;
+    otherwise the paths from _iter_files_suffix go to _bulk_unlink."""
+    if not _HAVE_DIR_FD:
+        return _bulk_unlink(list(_iter_files_suffix(root, suffixes, recursive)))
+    removed = 0
+    failed = []
+
+    def sweep(dirpath, names, dir_fd):
+        nonlocal removed
+        names = [n for n in names if _suffix_matches(n, suffixes)]
+        if names:
+            swept, errs = _bulk_unlink(names, dir_fd)
+            removed += swept
+            failed.extend((os.path.join(dirpath, n), e) for n, e in errs)
+
+    # os.open follows a symlinked root (like os.walk / Path.glob did); fwalk still skips nested symlinks
+    try:
+        fd = os.open(root, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return removed, failed
+    try:
+        if recursive:
+            # fwalk closes each dir_fd only after the loop body (and thus the unlinks) returned
+            for dirpath, _dirnames, filenames, dir_fd in os.fwalk(".", dir_fd=fd):
+                sweep(os.path.normpath(os.path.join(root, dirpath)), filenames, dir_fd)
+            return removed, failed
+        with os.scandir(fd) as it:
+            names = [e.name for e in it if not e.is_dir(follow_symlinks=False)]
+        sweep(root, names, fd)
+    finally:
+        os.close(fd)
+    return removed, failed
+
+
+def _remove_dir(path):
+    """Remove a directory tree; empty directories go through a single os.rmdir."""
+    try:
+        os.rmdir(path)
+    except OSError as e:
+        if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+            raise
+        shutil.rmtree(path)
+
+
+def _fast_copy(src, dst):
+    """Copy src -> dst. On Windows CopyFile2 also copies attributes and timestamps (a read-only
+    source gives a read-only copy); the shutil.copyfile fallback copies the data only."""
+    if _CopyFile2 is not None:
+        try:
+            if _CopyFile2(str(src), str(dst), None) == 0:  # S_OK
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+def _hash_file(path):
+    """Return blake2b digest of a file, read in 64KB chunks into one reused buffer."""
+    h = hashlib.blake2b(digest_size=16)
+    buf = bytearray(65536)
+    mv = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(mv[:n])
+    return h.digest()
 
 
 def ensure_translations():
@@ -111,13 +295,77 @@ def ensure_translations():
         print(f"Copied translations.json to {target_path}")
         return
 
-    # Compare contents
-    with open(bundled_path, 'rb') as f_bundled, open(target_path, 'rb') as f_target:
-        if f_bundled.read() != f_target.read():
-            shutil.copy(bundled_path, target_path)
-            print(f"Updated translations.json at {target_path}")
-        else:
-            print(f"translations.json is up to date at {target_path}")
+    # Compare contents (size first, then digests - never holds both files in memory)
+    if os.path.getsize(bundled_path) != os.path.getsize(target_path) \
+            or _hash_file(bundled_path) != _hash_file(target_path):
+        shutil.copyfile(bundled_path, target_path)
+        print(f"Updated translations.json at {target_path}")
+    else:
+        print(f"translations.json is up to date at {target_path}")
+
+
+_DETECTED_LANG = None  # system language, detected once per process
+
+
+def _detect_system_lang():
+    """Language code from LANG/LANGUAGE, else the user locale (Windows LCID / locale.getlocale)."""
+    loc = os.environ.get("LANG") or os.environ.get("LANGUAGE")
+    if not loc and sys.platform == "win32":
+        try:
+            import ctypes
+            loc = locale.windows_locale.get(ctypes.windll.kernel32.GetUserDefaultLCID())
+        except Exception:
+            loc = None
+    if not loc:
+        try:
+            loc = locale.getlocale()[0]
+        except Exception:
+            loc = None
+    if not loc:
+        return "en"
+    # e.g. "pl_PL.UTF-8" or "pl:en" (LANGUAGE) -> "pl"
+    return loc.split(":", 1)[0].split(".", 1)[0].split("_", 1)[0] or "en"
+
+
+class BotFolderMissing(FileNotFoundError):
+    """Bot folder doesn't exist (path in .filename); the GUI formats the translated message."""
+
+
+def _format_failures(failed, template):
+    """Lines for the first MAX_LOGGED_FAILURES (path, error) pairs formatted with template, plus one summary line."""
+    lines = [template.format(path=path, error=error) for path, error in failed[:MAX_LOGGED_FAILURES]]
+    extra = len(failed) - MAX_LOGGED_FAILURES
+    if extra > 0:
+        lines.append(f"... and {extra} more errors")
+    return lines
+
+
+def _clear_bot_core(bot_path):
+    """Delete logs/**/*.log and plugins/old/*.jar of one bot folder (str).
+    GUI-free and pickle-friendly (strings and ints only), so it can run in a worker process.
+    Return (logs_removed, jars_removed, warnings); a missing folder raises BotFolderMissing."""
+    logs = os.path.join(bot_path, "logs")
+    old = os.path.join(bot_path, "plugins", "old")
+    # os.path.isdir is one stat + S_ISDIR, the exists()+is_dir() pairs cost two
+    if not os.path.isdir(bot_path):
+        raise BotFolderMissing(errno.ENOENT, "Bot folder does not exist", bot_path)
+    warnings = []
+    logs_removed = jars_removed = 0
+
+    # logs/
+    if os.path.isdir(logs):
+        logs_removed, failed = _unlink_matching(logs, LOG_SUFFIXES)
+        warnings += _format_failures(failed, "Did not delete .log file {path}: {error}")
+    else:
+        warnings.append(f"Missing logs folder in {bot_path}")
+
+    # plugins/old/
+    if os.path.isdir(old):
+        jars_removed, failed = _unlink_matching(old, JAR_SUFFIXES, recursive=False)
+        warnings += _format_failures(failed, "Did not delete {path}: {error}")
+    else:
+        warnings.append(f"Missing plugins/old folder in {bot_path}")
+    return logs_removed, jars_removed, warnings
 
 
 class Translator:
@@ -128,38 +376,54 @@ class Translator:
 
         if self.lang not in self.translations:
             self.lang = "en"
+        self._current = self.translations.get(self.lang, {})
 
     def _load(self):
         try:
-            with open(self.translations_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            path = os.fspath(self.translations_path)
+            key = (path, os.stat(path).st_mtime_ns)
+            data = _TRANS_CACHE.get(key)
+            if data is None:
+                with open(path, "rb") as f:
+                    data = _json_loads(f.read())
+                _TRANS_CACHE[key] = data
+            return data
         except Exception:
             return {}
 
     def _detect_lang(self):
-        try:
-            loc = locale.getdefaultlocale()[0]
-            return loc.split("_")[0] if loc else "en"
-        except Exception:
-            return "en"
+        global _DETECTED_LANG
+        if _DETECTED_LANG is None:
+            _DETECTED_LANG = _detect_system_lang()
+        return _DETECTED_LANG
 
     def set_language(self, lang: str):
         self.lang = lang if lang in self.translations else "en"
+        self._current = self.translations.get(self.lang, {})
 
     def t(self, key: str, **kwargs):
-        text = self.translations.get(self.lang, {}).get(key, key)
+        text = self._current.get(key, key)
+        if not kwargs:
+            return text
         try:
-            return text.format(**kwargs)
+            return text.format_map(kwargs)
         except Exception:
             return text
 
 class DarkBotManagerGUI:
-    def __init__(self, root):
+    def __init__(self, root, interactive=True):
         self.root = root
+        self.interactive = interactive  # False (--no-prompt): completion notices go to the log, no modal boxes
         self.cfg = ensure_config()
         ensure_translations()  # Ensure translations before initializing translator
         self.translator = Translator(CONFIG_DIR / "translations.json", forced_lang=self.cfg.get("language"))
         self.tr = self.translator
+        self._translatable = []  # (widget, translation key) pairs of the main window
+        self._log_queue = collections.deque()  # (text, tag) waiting for _flush_log
+        self._log_flush_pending = False
+        self._last_progress_ts = 0.0
+        self._progress_shown = 0  # last value handed to the progress bar
+        self.debug = bool(os.environ.get("DARKBOT_DEBUG"))  # full traceback for every failed bot
         root.geometry("737x563")
         root.resizable(False, False)
         icon_path = resource_path("kekw.ico")
@@ -174,27 +438,37 @@ class DarkBotManagerGUI:
         self.refresh_bot_list()
 
     def _build_ui(self):
+        # Theme colors, looked up once for the Listbox and log widget
+        try:
+            bg = self.style.lookup("TFrame", "background") or "#222222"
+            fg = self.style.lookup("TLabel", "foreground") or "#ffffff"
+            sel_bg = self.style.lookup("TButton", "background") or "#444444"
+        except Exception:
+            bg = "#222222"
+            fg = "#ffffff"
+            sel_bg = "#444444"
+
         # Top control frame
         top = ttk.Frame(self.root, padding=6)
         top.pack(fill=X)
 
         self.bot_root_label = ttk.Label(top, text=self.tr.t("bot_root"))
-        self.bot_root_label.translation_key = "bot_root"  # Dodany atrybut
+        self._bind_text(self.bot_root_label, "bot_root")
         self.bot_root_label.pack(side=LEFT)
         self.bots_root_var = StringVar(value=self.cfg.get("bots_root", ""))
         self.bots_root_entry = ttk.Entry(top, textvariable=self.bots_root_var, width=49)
         self.bots_root_entry.pack(side=LEFT, padx=6)
         self.browse_bots_root_btn = ttk.Button(top, text=self.tr.t("bot_root_select"), command=self.browse_bots_root)
-        self.browse_bots_root_btn.translation_key = "bot_root_select"  # Dodany atrybut
+        self._bind_text(self.browse_bots_root_btn, "bot_root_select")
         self.browse_bots_root_btn.pack(side=LEFT)
         self.settings_btn = ttk.Button(top, text=self.tr.t("menu_settings"), command=self.open_settings)
-        self.settings_btn.translation_key = "menu_settings"  # Dodany atrybut
+        self._bind_text(self.settings_btn, "menu_settings")
         self.settings_btn.pack(side=LEFT, padx=6)
         self.config_folder_btn = ttk.Button(top, text=self.tr.t("settings_folder"), command=self.open_config_folder)
-        self.config_folder_btn.translation_key = "settings_folder"  # Dodany atrybut
+        self._bind_text(self.config_folder_btn, "settings_folder")
         self.config_folder_btn.pack(side=LEFT)
         self.extra_btn = ttk.Button(top, text=self.tr.t("extra_btn"), command=self.open_extra_links)
-        self.extra_btn.translation_key = "extra_btn"  # Dodany atrybut
+        self._bind_text(self.extra_btn, "extra_btn")
         self.extra_btn.pack(side=RIGHT, padx=2)
 
         # Middle: list of detected bot folders
@@ -205,16 +479,16 @@ class DarkBotManagerGUI:
         lb_frame.pack(side=LEFT, fill=BOTH, expand=True)
 
         self.folder_list_label = ttk.Label(lb_frame, text=self.tr.t("folder_list"))
-        self.folder_list_label.translation_key = "folder_list"  # Dodany atrybut
+        self._bind_text(self.folder_list_label, "folder_list")
         self.folder_list_label.pack(anchor="w")
         self.listbox = tk.Listbox(
             lb_frame,
             selectmode=MULTIPLE,
             width=60, height=12,
-            bg=self.style.lookup("TFrame", "background"),
-            fg=self.style.lookup("TLabel", "foreground"),
-            highlightbackground=self.style.lookup("TLabel", "foreground"),
-            selectbackground=self.style.lookup("TButton", "background"),
+            bg=bg,
+            fg=fg,
+            highlightbackground=fg,
+            selectbackground=sel_bg,
         )
         self.listbox.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar = ttk.Scrollbar(lb_frame, orient=VERTICAL, command=self.listbox.yview)
@@ -226,32 +500,26 @@ class DarkBotManagerGUI:
         right.pack(side=RIGHT, fill=Y)
 
         self.refresh_list_btn = ttk.Button(right, text=self.tr.t("btn_refresh_list"), width=30, command=self.refresh_bot_list)
-        self.refresh_list_btn.translation_key = "btn_refresh_list"  # Dodany atrybut
+        self._bind_text(self.refresh_list_btn, "btn_refresh_list")
         self.refresh_list_btn.pack(pady=6)
         self.clear_update_selected_btn = ttk.Button(right, text=self.tr.t("btn_clear_update_selected"), width=30, command=self.run_on_selected)
-        self.clear_update_selected_btn.translation_key = "btn_clear_update_selected"  # Dodany atrybut
+        self._bind_text(self.clear_update_selected_btn, "btn_clear_update_selected")
         self.clear_update_selected_btn.pack(pady=6)
         self.clear_update_all_btn = ttk.Button(right, text=self.tr.t("btn_clear_update_all"), width=30, command=self.run_on_all)
-        self.clear_update_all_btn.translation_key = "btn_clear_update_all"  # Dodany atrybut
+        self._bind_text(self.clear_update_all_btn, "btn_clear_update_all")
         self.clear_update_all_btn.pack(pady=6)
         self.clear_logsold_btn = ttk.Button(right, text=self.tr.t("btn_clear_logsold"), width=30, command=self.clear_old_logs)
-        self.clear_logsold_btn.translation_key = "btn_clear_logsold"  # Dodany atrybut
+        self._bind_text(self.clear_logsold_btn, "btn_clear_logsold")
         self.clear_logsold_btn.pack(pady=6)
         self.validate_paths_btn = ttk.Button(right, text=self.tr.t("btn_validate_paths"), width=30, command=self.validate_paths_and_report)
-        self.validate_paths_btn.translation_key = "btn_validate_paths"  # Dodany atrybut
+        self._bind_text(self.validate_paths_btn, "btn_validate_paths")
         self.validate_paths_btn.pack(pady=6)
         # Log area
         log_frame = ttk.Frame(self.root, padding=6)
         log_frame.pack(fill=BOTH, expand=True)
         self.log_label = ttk.Label(log_frame, text=self.tr.t("log_label"))
-        self.log_label.translation_key = "log_label"  # Dodany atrybut
+        self._bind_text(self.log_label, "log_label")
         self.log_label.pack(anchor="w")
-        try:
-            bg = self.style.lookup("TFrame", "background") or "#222222"
-            fg = self.style.lookup("TLabel", "foreground") or "#ffffff"
-        except Exception:
-            bg = "#222222"
-            fg = "#ffffff"
         self.log = ScrolledText(
             log_frame,
             height=12, state="disabled",
@@ -271,21 +539,28 @@ class DarkBotManagerGUI:
         self.footer_discord_label = ttk.Label(text="Discord: crazygirl3598", foreground="lightblue")
         self.footer_discord_label.pack(side="right")
         self.footer_text_label = ttk.Label(text=self.tr.t("footer_text"), foreground="lightblue")
-        self.footer_text_label.translation_key = "footer_text"  # Dodany atrybut
+        self._bind_text(self.footer_text_label, "footer_text")
         self.footer_text_label.pack(side="left")
 
-    def refresh_texts(self, widget=None):
-        """Rekurencyjne odświeżanie tekstów w wszystkich widgetach z atrybutem translation_key."""
-        if widget is None:
-            widget = self.root  # Zaczynamy od roota
-            self.root.title(self.tr.t("app_title"))  # Odśwież tytuł okna
-        
-        if hasattr(widget, 'translation_key'):
-            key = widget.translation_key
-            widget.config(text=self.tr.t(key))
-        
-        for child in widget.winfo_children():
-            self.refresh_texts(child)
+    def _bind_text(self, widget, key, registry=None):
+        """Zapamiętuje (widget, klucz) do odświeżania tekstów; registry=None -> główne okno."""
+        (self._translatable if registry is None else registry).append((widget, key))
+
+    def _apply_texts(self, pairs):
+        """Ustawia przetłumaczone teksty; zniszczone widgety są usuwane z listy."""
+        alive = []
+        for widget, key in pairs:
+            try:
+                widget.config(text=self.tr.t(key))
+            except tk.TclError:
+                continue
+            alive.append((widget, key))
+        pairs[:] = alive
+
+    def refresh_texts(self):
+        """Odświeżanie tekstów w widgetach głównego okna zarejestrowanych przez _bind_text."""
+        self.root.title(self.tr.t("app_title"))  # Odśwież tytuł okna
+        self._apply_texts(self._translatable)
 
     def browse_bots_root(self):
         p = filedialog.askdirectory(title=self.tr.t("window_select_bot_root"), initialdir=self.bots_root_var.get() or None)
@@ -297,8 +572,8 @@ class DarkBotManagerGUI:
 
     def open_config_folder(self):
         try:
-            os.startfile(str(CONFIG_DIR))
-        except Exception:
+            _open_folder(str(CONFIG_DIR))
+        except OSError:
             messagebox.showinfo(self.tr.t("window_config_folder_error"), self.tr.t("window_config_folder_error_msg").format(path=CONFIG_DIR))
 
     def open_settings(self):
@@ -325,12 +600,13 @@ class DarkBotManagerGUI:
 
         frame = ttk.Frame(S, padding=10)
         frame.pack(fill=BOTH, expand=True)
+        texts = []  # (widget, key) tylko dla tego okna
 
         def add_row(label_text_key, varname, browse_type="dir"):
             row = ttk.Frame(frame)
             row.pack(fill=X, pady=5)
             label = ttk.Label(row, text=self.tr.t(label_text_key), width=27, anchor="w")
-            label.translation_key = label_text_key  # Dodany atrybut dla labeli w ustawieniach
+            self._bind_text(label, label_text_key, texts)
             label.pack(side=LEFT)
             v = StringVar(value=self.cfg.get(varname, ""))
             ent = ttk.Entry(row, textvariable=v, width=50)
@@ -347,7 +623,7 @@ class DarkBotManagerGUI:
                 if p:
                     v.set(p)
             btn = ttk.Button(row, text=self.tr.t("btn_settings_select"), command=browse)
-            btn.translation_key = "btn_settings_select"  # Dodany atrybut
+            self._bind_text(btn, "btn_settings_select", texts)
             btn.pack(side=LEFT)
             return v
 
@@ -368,10 +644,10 @@ class DarkBotManagerGUI:
         btn_row = ttk.Frame(frame)
         btn_row.pack(fill=X, pady=10)
         save_btn = ttk.Button(btn_row, text=self.tr.t("window_settings_btn_save"), command=save_and_close)
-        save_btn.translation_key = "window_settings_btn_save"  # Dodany atrybut
+        self._bind_text(save_btn, "window_settings_btn_save", texts)
         save_btn.pack(side=LEFT, padx=6)
         cancel_btn = ttk.Button(btn_row, text=self.tr.t("window_settings_btn_cancel"), command=S.destroy)
-        cancel_btn.translation_key = "window_settings_btn_cancel"  # Dodany atrybut
+        self._bind_text(cancel_btn, "window_settings_btn_cancel", texts)
         cancel_btn.pack(side=LEFT)
 
         # === Sekcja wyboru języka ===
@@ -382,7 +658,7 @@ class DarkBotManagerGUI:
         lang_inner.pack(fill=X)
 
         lang_label = ttk.Label(lang_inner, text=self.tr.t("label_language"))
-        lang_label.translation_key = "label_language"
+        self._bind_text(lang_label, "label_language", texts)
         lang_label.pack(side=LEFT)
 
         langs = ["pl", "en", "tr"]
@@ -396,14 +672,14 @@ class DarkBotManagerGUI:
             text=self.tr.t("btn_save_lang"),
             command=lambda: self.save_language(S, lang_var.get())
         )
-        save_lang_btn.translation_key = "btn_save_lang"
+        self._bind_text(save_lang_btn, "btn_save_lang", texts)
         save_lang_btn.pack(side=LEFT)
 
-        # Dodajemy translation_key również do LabelFrame
-        lang_frame.translation_key = "label_language_section"
+        # Rejestrujemy również LabelFrame
+        self._bind_text(lang_frame, "label_language_section", texts)
 
         # Odśwież teksty w oknie ustawień
-        self.refresh_texts(S)
+        self._apply_texts(texts)
 
     def save_language(self, settings_window, new_lang):
         self.cfg["language"] = new_lang
@@ -418,10 +694,11 @@ class DarkBotManagerGUI:
         if not bots_root or not bots_root.exists():
             self.log_warn(self.tr.t("window_main_warn_no_bot_root"))
             return
-        children = sorted([p for p in bots_root.iterdir() if p.is_dir()], key=lambda p: p.name.lower())
-        for p in children:
-            if is_bot_folder(p):
-                self.listbox.insert(END, str(p))
+        with os.scandir(bots_root) as it:
+            entries = [e for e in it if is_bot_folder(e)]
+        entries.sort(key=lambda e: e.name.lower())
+        if entries:
+            self.listbox.insert(END, *[e.path for e in entries])  # one Tcl call for the whole list
         self.log_info(self.tr.t("window_main_log_loaded_bots", count=self.listbox.size(), root=bots_root))
 
     def validate_paths_and_report(self):
@@ -475,6 +752,7 @@ class DarkBotManagerGUI:
 
         frame = ttk.Frame(extra_win, padding=15)
         frame.pack(fill=BOTH, expand=True)
+        texts = []  # (widget, key) tylko dla tego okna
 
         ttk.Label(frame, text=self.tr.t("extra_window_title"), font=("-size", 14, "-weight", "bold")).pack(pady=(0, 15))
 
@@ -498,21 +776,15 @@ class DarkBotManagerGUI:
             open_btn.configure(command=lambda u=url: webbrowser.open_new(u))
             open_btn.pack(side=LEFT, padx=5)
         # Tłumaczenie przycisku
-            try:
-                open_btn.translation_key = "btn_open_link"  # dla refresh_texts
-            except:
-                pass
+            self._bind_text(open_btn, "btn_open_link", texts)
 
             copy_btn = ttk.Button(row, text=self.tr.t("btn_copy_link"), width=12)
             copy_btn.configure(command=lambda u=url, w=extra_win: self.copy_to_clipboard(u, w))
             copy_btn.pack(side=LEFT)
-            try:
-                copy_btn.translation_key = "btn_copy_link"
-            except:
-                pass
+            self._bind_text(copy_btn, "btn_copy_link", texts)
 
     # Odśwież tłumaczenia w nowym oknie
-        self.refresh_texts(extra_win)
+        self._apply_texts(texts)
 
     def copy_to_clipboard(self, text: str, parent_window):
         """Kopiuje tekst do schowka i pokazuje potwierdzenie"""
@@ -525,11 +797,61 @@ class DarkBotManagerGUI:
 
     # Logging helpers
     def _log(self, text, tag=None):
+        # lines are buffered and written by the Tk thread in batches (see _flush_log);
+        # append before checking the flag so a concurrent flush can't miss the line
+        self._log_queue.append((text + "\n", tag or ""))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_pending = False
+        args = []
+        while self._log_queue:
+            args.extend(self._log_queue.popleft())
+        if not args:
+            return
         self.log.text.configure(state="normal")
-        self.log.text.insert(END, text + "\n", tag)
+        self.log.text.insert(END, *args)  # text1, tag1, text2, tag2, ... in one Tcl call
         self.log.text.see(END)
         self.log.text.configure(state="disabled")
 
+    def _start_progress(self, total):
+        # posted with after_idle like the updates in _set_progress, so they run in order
+        self._progress_shown = 0
+        self.root.after_idle(lambda: self.progress.configure(value=0, maximum=total))
+
+    def _set_progress(self, value, total):
+        """Thread-safe progress update, throttled to one redraw per PROGRESS_INTERVAL.
+        Intermediate updates use Progressbar.step; the final one sets the value directly,
+        because step() wraps around to 0 once it reaches maximum."""
+        now = time.monotonic()
+        if value == total:
+            self._progress_shown = value
+            self.root.after_idle(lambda: self.progress.configure(value=total))
+        elif now - self._last_progress_ts >= PROGRESS_INTERVAL:
+            delta = value - self._progress_shown
+            self._progress_shown = value
+            self._last_progress_ts = now
+            self.root.after_idle(self.progress.step, delta)
+
+    def _notify_done(self, title, msg):
+        """Completion notice from a worker thread: modal box when interactive, log line otherwise."""
+        def show():
+            # let queued log lines and progress updates land before a modal blocks the window
+            self._flush_log()
+            self.root.update_idletasks()
+            if self.interactive:
+                messagebox.showinfo(title, msg)
+            else:
+                self.log_success(msg)
+        self.root.after(0, show)
+
+    def _warn_failures(self, failed, template):
+        """Log the first MAX_LOGGED_FAILURES (path, error) pairs with template, then one summary line."""
+        for line in _format_failures(failed, template):
+            self.log_warn(line)
+
     def log_info(self, text):
         self._log(text, "info")
 
@@ -573,7 +895,8 @@ class DarkBotManagerGUI:
         t = threading.Thread(target=self._run_worker, args=(all_items,), daemon=True)
         t.start()
 
-        messagebox.showinfo(self.tr.t("window_info_name_done"), self.tr.t("msg_info_done"))
+        if self.interactive:
+            messagebox.showinfo(self.tr.t("window_info_name_done"), self.tr.t("msg_info_done"))
 
     def clear_old_logs(self):
         all_items = [self.listbox.get(i) for i in range(self.listbox.size())]
@@ -586,181 +909,221 @@ class DarkBotManagerGUI:
 
 
     def _run_worker(self, bot_paths):
+        """Runs on a worker thread; Tk calls are handed to the main loop via after/after_idle."""
         total = len(bot_paths)
-        self.progress["value"] = 0
-        self.progress["maximum"] = total
+        self._start_progress(total)
         self.log_info(self.tr.t("log_msg_info_operation_start", total=total))
+        # sources are the same for every bot - validate and list them once
         darkjar = Path(self.cfg.get("darkbot_jar_path", ""))
-        plugin_src = Path(self.cfg.get("plugin_updates_folder", ""))
+        if not (darkjar.is_file() and darkjar.name == "DarkBot.jar"):
+            self.log_warn(f"Invalid or missing DarkBot.jar file: {darkjar} - skipping copy.")
+            darkjar = None
+        # read DarkBot.jar once and write the same buffer to every bot; huge files are streamed instead
+        darkjar_bytes = None
+        if darkjar is not None:
+            try:
+                if darkjar.stat().st_size <= DARKJAR_BUFFER_LIMIT:
+                    darkjar_bytes = darkjar.read_bytes()
+            except OSError:
+                darkjar_bytes = None
+        plugin_jars = self._list_plugin_jars(Path(self.cfg.get("plugin_updates_folder", "")))
         errors = 0
 
-        for idx, bp in enumerate(bot_paths, start=1):
-            try:
-                self.log_info(f"[{idx}/{total}] -> Processing: {bp}")
-                self.process_single_bot(Path(bp), darkjar, plugin_src)
-                self.log_success(f"[{idx}/{total}] Completed: {bp}")
-            except Exception as e:
-                errors += 1
-                tb = traceback.format_exc()
-                self.log_error(f"[{idx}/{total}] Error processing {bp}: {e}")
-                self.log_info(tb)
-            finally:
-                self.progress["value"] = idx
+        def run_one(idx, bp):
+            # logged when a worker actually picks the bot up, not when it is queued
+            self.log_info(f"[{idx}/{total}] -> Processing: {bp}")
+            self.process_single_bot(Path(bp), darkjar, plugin_jars, darkjar_bytes)
+
+        # bots are independent and I/O-bound -> process them concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=BOT_WORKERS) as executor:
+            futures = {executor.submit(run_one, idx, bp): (idx, bp) for idx, bp in enumerate(bot_paths, start=1)}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                idx, bp = futures[future]
+                try:
+                    future.result()
+                    self.log_success(f"[{idx}/{total}] Completed: {bp}")
+                except Exception as e:
+                    errors += 1
+                    if isinstance(e, BotFolderMissing):
+                        # error path only - t() guards against broken placeholders in the translation
+                        reason = self.tr.t("msg_error_bot_folder_does_not_exist", bot_path=e.filename)
+                    else:
+                        reason = f"{type(e).__name__}: {e}"
+                    self.log_error(f"[{idx}/{total}] Error processing {bp}: {reason}")
+                    if self.debug or errors == 1:
+                        self.log_info(traceback.format_exc())
+                finally:
+                    self._set_progress(done, total)
 
         if errors == 0:
             self.log_success(f"Operation completed successfully for {total} folders.")
         else:
             self.log_warn(f"Operation completed with {errors} errors (see log).")
-        messagebox.showinfo("Done", "Operation completed. Check the log.")
+        self._notify_done("Done", "Operation completed. Check the log.")
 
-    def process_single_bot(self, bot_path: Path, darkjar_src: Path, plugin_src_folder: Path):
-        if not bot_path.exists() or not bot_path.is_dir():
-            raise FileNotFoundError(self.tr.t("msg_error_bot_folder_does_not_exist", bot_path=bot_path))
+    def _list_plugin_jars(self, plugin_src_folder: Path):
+        """Return paths of plugin .jar files to distribute, or None if the source folder is invalid."""
+        if not plugin_src_folder.is_dir():
+            self.log_warn(f"Invalid plugin updates folder: {plugin_src_folder} - skipping plugin copy.")
+            return None
+        jars = []
+        try:
+            with os.scandir(plugin_src_folder) as it:
+                for e in it:
+                    if not _suffix_matches(e.name, JAR_SUFFIXES) or not e.is_file():
+                        continue
+                    if e.name == "DarkBot.jar":
+                        self.log_warn(f"Skipped {e.name} in plugins folder (DarkBot.jar files are not plugins).")
+                        continue
+                    jars.append(e.path)
+        except OSError as e:
+            # unreadable source must not abort the whole run before any bot is processed
+            self.log_warn(f"Invalid plugin updates folder: {plugin_src_folder} ({e}) - skipping plugin copy.")
+            return None
+        return jars
+
+    def process_single_bot(self, bot_path: Path, darkjar_src, plugin_jars, darkjar_bytes=None):
+        """darkjar_src: validated DarkBot.jar or None, plugin_jars: result of _list_plugin_jars,
+        darkjar_bytes: preloaded content of darkjar_src (copied from disk when None)."""
+        # fixed children of the bot folder, joined once as plain strings
+        bp_str = str(bot_path)
+        if not os.path.isdir(bp_str):
+            raise BotFolderMissing(errno.ENOENT, "Bot folder does not exist", bp_str)
+        logs_dir = os.path.join(bp_str, "logs")
+        plugins_old = os.path.join(bp_str, "plugins", "old")
+        plugins_updates = os.path.join(bp_str, "plugins", "updates")
+        unlink = os.unlink  # plugins/updates loop below works on DirEntry.path strings
 
         # 1) logs
-        logs_dir = bot_path / "logs"
-        if logs_dir.exists() and logs_dir.is_dir():
-            removed = 0
-            for f in logs_dir.glob("**/*.log"):
-                try:
-                    f.unlink()
-                    removed += 1
-                except Exception as e:
-                    self.log_warn(f"Did not remove log file {f}: {e}")
+        if os.path.isdir(logs_dir):
+            removed, failed = _unlink_matching(logs_dir, LOG_SUFFIXES)
+            self._warn_failures(failed, "Did not remove log file {path}: {error}")
             self.log_info(f"Removed {removed} .log files in {logs_dir}")
         else:
             self.log_warn(f"No logs folder in {bot_path} - skipping.")
 
         # 2) plugins/old
-        plugins_old = bot_path / "plugins" / "old"
-        if plugins_old.exists() and plugins_old.is_dir():
-            removed = 0
-            for jar in plugins_old.glob("*.jar"):
-                try:
-                    jar.unlink()
-                    removed += 1
-                except Exception as e:
-                    self.log_warn(f"Did not remove {jar}: {e}")
+        if os.path.isdir(plugins_old):
+            removed, failed = _unlink_matching(plugins_old, JAR_SUFFIXES, recursive=False)
+            self._warn_failures(failed, "Did not remove {path}: {error}")
             self.log_info(f"Removed {removed} .jar files in {plugins_old}")
         else:
             self.log_warn(f"No plugins/old folder in {bot_path} - skipping.")
 
         # 3) plugins/updates -> delete all files inside (but keep folder)
-        plugins_updates = bot_path / "plugins" / "updates"
-        if plugins_updates.exists() and plugins_updates.is_dir():
+        if os.path.isdir(plugins_updates):
             removed = 0
-            for p in plugins_updates.iterdir():
-                try:
-                    if p.is_file():
-                        p.unlink()
-                        removed += 1
-                    elif p.is_dir():
-                        shutil.rmtree(p)
+            with os.scandir(plugins_updates) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            _remove_dir(e.path)
+                        else:
+                            unlink(e.path)
                         removed += 1
-                except Exception as e:
-                    self.log_warn(f"Did not remove {p}: {e}")
+                    except OSError as ex:
+                        self.log_warn(f"Did not remove {e.path}: {ex}")
             self.log_info(f"Removed {removed} elements in {plugins_updates}")
         else:
             try:
-                plugins_updates.mkdir(parents=True, exist_ok=True)
+                os.makedirs(plugins_updates, exist_ok=True)
                 self.log_info(f"Created folder {plugins_updates}")
             except Exception as e:
                 self.log_warn(f"Failed to create {plugins_updates}: {e}")
 
         # 4) copy DarkBot.jar
-        if darkjar_src and darkjar_src.exists() and darkjar_src.is_file() and darkjar_src.name == "DarkBot.jar":
-            dest = bot_path / "DarkBot.jar"
+        if darkjar_src is not None:
+            dest = os.path.join(bp_str, "DarkBot.jar")
             try:
-                shutil.copy2(str(darkjar_src), str(dest))
+                if darkjar_bytes is not None:
+                    with open(dest, "wb") as f:
+                        f.write(darkjar_bytes)
+                else:
+                    _fast_copy(darkjar_src, dest)
                 self.log_info(f"Copied DarkBot.jar -> {dest}")
             except Exception as e:
                 self.log_warn(f"Failed to copy DarkBot.jar to {bot_path}: {e}")
-        else:
-            self.log_warn(f"Invalid or missing DarkBot.jar file: {darkjar_src} - skipping copy.")
 
         # 5) copy plugin jars
-        if plugin_src_folder and plugin_src_folder.exists() and plugin_src_folder.is_dir():
-            copied = 0
-            for jar in Path(plugin_src_folder).glob("*.jar"):
-                if jar.name == "DarkBot.jar":
-                    self.log_warn(f"Skipped {jar.name} in plugins folder (DarkBot.jar files are not plugins).")
-                    continue
+        if plugin_jars is not None:
+            def copy_one(jar):
                 try:
-                    dest = plugins_updates / jar.name
-                    shutil.copy2(str(jar), str(dest))
-                    copied += 1
+                    _fast_copy(jar, os.path.join(plugins_updates, os.path.basename(jar)))
+                    return 1
                 except Exception as e:
                     self.log_warn(f"Failed to copy {jar} to {plugins_updates}: {e}")
+                    return 0
+
+            copied = sum(PLUGIN_COPY_EXECUTOR.map(copy_one, plugin_jars))
             self.log_info(f"Copied {copied} plugins to {plugins_updates}")
-        else:
-            self.log_warn(f"Invalid plugin updates folder: {plugin_src_folder} - skipping plugin copy.")
 
     def clear_old_logs_worker(self, bot_paths):
+        """Runs on a worker thread; Tk calls are handed to the main loop via after/after_idle."""
         total = len(bot_paths)
-        self.progress["value"] = 0
-        self.progress["maximum"] = total
+        self._start_progress(total)
         self.log_info(f"Start clearing in {total} folders...")
+        # translated texts used by this run, looked up once
+        done_title = self.tr.t("window_info_name_clearing_completed")
+        done_msg = self.tr.t("msg_info_clearing_completed")
 
         errors = 0
 
-        for idx, bp in enumerate(bot_paths, start=1):
-            try:
+        # worker processes only pay off for DeleteFile on Windows and only for many bots - each one
+        # re-imports this module (relaunches the exe when frozen); elsewhere threads do the same job
+        if sys.platform == "win32" and total >= CLEAR_PROCESS_MIN_BOTS:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(CLEAR_WORKERS, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(CLEAR_WORKERS, total))
+        with executor:
+            futures = {}
+            for idx, bp in enumerate(bot_paths, start=1):
                 self.log_info(f"[{idx}/{total}] -> Clearing: {bp}")
-                self.clear_single_bot(Path(bp))
-                self.log_success(f"[{idx}/{total}] Cleared: {bp}")
-            except Exception as e:
-                errors += 1
-                tb = traceback.format_exc()
-                self.log_error(f"[{idx}/{total}] Error while clearing {bp}: {e}")
-                self.log_info(tb)
-            finally:
-                self.progress["value"] = idx
+                futures[executor.submit(_clear_bot_core, os.fspath(bp))] = (idx, bp)
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                idx, bp = futures[future]
+                try:
+                    self._report_cleared(os.fspath(bp), future.result())
+                    self.log_success(f"[{idx}/{total}] Cleared: {bp}")
+                except Exception as e:
+                    errors += 1
+                    if isinstance(e, BotFolderMissing):
+                        # error path only - t() guards against broken placeholders in the translation
+                        reason = self.tr.t("msg_error_bot_folder_does_not_exist", bot_path=e.filename)
+                    else:
+                        reason = f"{type(e).__name__}: {e}"
+                    self.log_error(f"[{idx}/{total}] Error while clearing {bp}: {reason}")
+                    if self.debug or errors == 1:
+                        self.log_info(traceback.format_exc())
+                finally:
+                    self._set_progress(done, total)
 
         if errors == 0:
             self.log_success(f"Clearing completed successfully for {total} folders.")
         else:
             self.log_warn(f"Clearing completed with {errors} errors (details in log).")
 
-        messagebox.showinfo(self.tr.t("window_info_name_clearing_completed"), self.tr.t("msg_info_clearing_completed"))
-
-    def clear_single_bot(self, bot_path: Path):
-        if not bot_path.exists() or not bot_path.is_dir():
-            raise FileNotFoundError(self.tr.t("msg_error_bot_folder_does_not_exist", bot_path=bot_path))
+        self._notify_done(done_title, done_msg)
 
-        # logs/
-        logs = bot_path / "logs"
-        if logs.exists() and logs.is_dir():
-            removed = 0
-            for f in logs.glob("**/*.log"):
-                try:
-                    f.unlink()
-                    removed += 1
-                except Exception as e:
-                    self.log_warn(f"Did not delete .log file {f}: {e}")
-            self.log_info(f"Removed {removed} .log files in {logs}")
-        else:
-            self.log_warn(f"Missing logs folder in {bot_path}")
-
-        # plugins/old/
-        old = bot_path / "plugins" / "old"
-        if old.exists() and old.is_dir():
-            removed = 0
-            for jar in old.glob("*.jar"):
-                try:
-                    jar.unlink()
-                    removed += 1
-                except Exception as e:
-                    self.log_warn(f"Did not delete {jar}: {e}")
-            self.log_info(f"Removed {removed} .jar files in {old}")
-        else:
-            self.log_warn(f"Missing plugins/old folder in {bot_path}")
+    def _report_cleared(self, bot_path, result):
+        """Log the outcome (as returned by _clear_bot_core) of clearing one bot folder."""
+        logs_removed, jars_removed, warnings = result
+        for line in warnings:
+            self.log_warn(line)
+        if logs_removed:
+            self.log_info(f"Removed {logs_removed} .log files in {os.path.join(bot_path, 'logs')}")
+        if jars_removed:
+            self.log_info(f"Removed {jars_removed} .jar files in {os.path.join(bot_path, 'plugins', 'old')}")
 
 
 # Launcher
 def main():
     root = Tk()
-    app = DarkBotManagerGUI(root)
+    app = DarkBotManagerGUI(root, interactive="--no-prompt" not in sys.argv[1:])
     app.start()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # clearing workers are spawned processes (PyInstaller build)
     main()
\ No newline at end of file